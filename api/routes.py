@@ -2,10 +2,10 @@
 API Routes for Digital Twin System
 """
 
-from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, status
+from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, Response, status
 from typing import Dict, List, Optional, Any
-import json
 import logging
+import orjson
 from datetime import timedelta, datetime
 
 from core.digital_twin_engine import DigitalTwinEngine
@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Create API router
 api_router = APIRouter()
 
+# WebSocket and export payloads may carry NumPy scalars and non-string keys from the models
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 # Authentication Endpoints
 @api_router.post("/auth/register", response_model=Dict[str, str])
 async def register_user(
@@ -417,13 +420,13 @@ async def websocket_twin_endpoint(
         while True:
             # Receive message
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             
             # Process interaction
             response = await engine.process_interaction(twin_id, message)
             
-            # Send response back
-            await websocket.send_text(json.dumps(response))
+            # Send response back as a JSON text frame
+            await websocket.send_text(orjson.dumps(response, option=_JSON_OPTIONS).decode())
             
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for twin: {twin_id}")
@@ -476,8 +479,6 @@ async def export_twin_data(
         if not twin:
             raise HTTPException(status_code=404, detail="Digital twin not found")
         
-        # Get complete twin state
-        twin_state = await engine.get_twin_state(twin_id)
         export_data = {
             "twin_id": twin_id,
             "export_timestamp": datetime.now().isoformat(),
@@ -497,7 +498,8 @@ async def export_twin_data(
             } for pattern in twin.behavior_patterns]
         }
         
-        return export_data
+        # Serialize straight to bytes instead of deep-copying the export through jsonable_encoder
+        return Response(content=orjson.dumps(export_data, option=_JSON_OPTIONS), media_type="application/json")
         
     except HTTPException:
         raise
@@ -668,11 +670,23 @@ async def get_system_analytics(engine: DigitalTwinEngine = Depends(get_engine)):
     """Get system-wide analytics"""
     try:
         total_twins = len(engine.twins)
-        active_twins = sum(1 for twin in engine.twins.values() if twin.is_active)
         
-        # Aggregate metrics
-        total_interactions = sum(len(twin.interaction_log) for twin in engine.twins.values())
-        total_conversations = sum(len(twin.conversation_history) for twin in engine.twins.values())
+        # Aggregate metrics and personality trait totals in a single pass
+        active_twins = 0
+        total_interactions = 0
+        total_conversations = 0
+        openness = conscientiousness = extraversion = agreeableness = neuroticism = 0.0
+        for twin in engine.twins.values():
+            if twin.is_active:
+                active_twins += 1
+            total_interactions += len(twin.interaction_log)
+            total_conversations += len(twin.conversation_history)
+            traits = twin.personality_traits
+            openness += traits.openness
+            conscientiousness += traits.conscientiousness
+            extraversion += traits.extraversion
+            agreeableness += traits.agreeableness
+            neuroticism += traits.neuroticism
         
         # System health
         system_status = engine.get_system_status()
@@ -680,11 +694,11 @@ async def get_system_analytics(engine: DigitalTwinEngine = Depends(get_engine)):
         # Average personality traits across all twins
         if total_twins > 0:
             avg_traits = {
-                "openness": sum(twin.personality_traits.openness for twin in engine.twins.values()) / total_twins,
-                "conscientiousness": sum(twin.personality_traits.conscientiousness for twin in engine.twins.values()) / total_twins,
-                "extraversion": sum(twin.personality_traits.extraversion for twin in engine.twins.values()) / total_twins,
-                "agreeableness": sum(twin.personality_traits.agreeableness for twin in engine.twins.values()) / total_twins,
-                "neuroticism": sum(twin.personality_traits.neuroticism for twin in engine.twins.values()) / total_twins
+                "openness": openness / total_twins,
+                "conscientiousness": conscientiousness / total_twins,
+                "extraversion": extraversion / total_twins,
+                "agreeableness": agreeableness / total_twins,
+                "neuroticism": neuroticism / total_twins
             }
         else:
             avg_traits = {}
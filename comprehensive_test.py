@@ -6,557 +6,459 @@ Tests all major components and functionality
 
 import asyncio
 import logging
+import logging.handlers
 import json
 import sys
 import os
 from datetime import datetime
-from typing import Dict, Any
+from enum import Enum
+from typing import Dict, Any, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging; records are buffered and written in batches, errors flush immediately
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_buffer = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_log_stream)
+logging.basicConfig(level=os.environ.get("TEST_LOGLEVEL", "INFO"), handlers=[log_buffer])
 logger = logging.getLogger(__name__)
 
+class Status(Enum):
+    """Outcome of a single test"""
+    PASSED = "✅ PASSED"
+    SKIPPED = "⚠️ SKIPPED"
+    FAILED = "❌ FAILED"
+
 class ComprehensiveTester:
     """Comprehensive test suite for digital twin system"""
     
     def __init__(self):
-        self.test_results = {}
+        self.test_results: Dict[str, Tuple[Status, str]] = {}
         self.start_time = datetime.now()
         self.total_tests = 0
         self.passed_tests = 0
         self.failed_tests = 0
+        self.engine = None
+        self.test_timeout = 60  # seconds allowed per test
     
     async def run_all_tests(self):
         """Run all comprehensive tests"""
         logger.info("🚀 Starting Comprehensive Digital Twin System Tests...")
-        logger.info(f"Test started at: {self.start_time}")
+        logger.info("Test started at: %s", self.start_time)
         
         try:
             # Test 1: Core System Initialization
-            await self.test_core_system_initialization()
-            
-            # Test 2: Digital Twin Lifecycle
-            await self.test_digital_twin_lifecycle()
-            
-            # Test 3: AI/ML Components
-            await self.test_ai_ml_components()
-            
-            # Test 4: Data Management
-            await self.test_data_management()
-            
-            # Test 5: Health Monitoring
-            await self.test_health_monitoring()
-            
-            # Test 6: Visualization Engine
-            await self.test_visualization_engine()
-            
-            # Test 7: System Integration
-            await self.test_system_integration()
-            
-            # Test 8: Performance and Stress Tests
-            await self.test_performance()
-            
-            # Test 9: Error Handling
-            await self.test_error_handling()
+            await self.run_test("core_system_initialization", "Core System Initialization", self.test_core_system_initialization)
+            
+            # Tests 2-9 share one initialized engine and all fail if it cannot be set up
+            engine_ready = await self.run_test("engine_setup", "Shared Engine Setup", self.setup_engine)
+            
+            engine_tests = [
+                ("digital_twin_lifecycle", "Digital Twin Lifecycle", self.test_digital_twin_lifecycle),
+                ("ai_ml_components", "AI/ML Components", self.test_ai_ml_components),
+                ("data_management", "Data Management", self.test_data_management),
+                ("health_monitoring", "Health Monitoring", self.test_health_monitoring),
+                ("visualization_engine", "Visualization Engine", self.test_visualization_engine),
+                ("system_integration", "System Integration", self.test_system_integration),
+                ("performance", "Performance Tests", self.test_performance),
+                ("error_handling", "Error Handling", self.test_error_handling),
+            ]
+            for name, title, test in engine_tests:
+                if engine_ready:
+                    await self.run_test(name, title, test)
+                else:
+                    self.record_failure(name, "shared engine setup failed")
             
             # Test 10: API Endpoints
-            await self.test_api_endpoints()
+            await self.run_test("api_endpoints", "API Endpoints", self.test_api_endpoints)
             
         except Exception as e:
-            logger.error(f"Critical error during testing: {e}")
-            self.test_results["critical_error"] = str(e)
+            logger.error("Critical error during testing: %s", e)
+            self.record_failure("critical_error", str(e))
         
         finally:
+            if self.engine:
+                try:
+                    await self.engine.shutdown()
+                except Exception as e:
+                    logger.warning("Shared engine shutdown failed: %s", e)
             await self.generate_test_report()
     
+    async def run_test(self, name: str, title: str, test) -> bool:
+        """Run a single test and record its outcome; returns whether it passed"""
+        try:
+            result = await asyncio.wait_for(test(), timeout=self.test_timeout) or (Status.PASSED, "")
+        except asyncio.TimeoutError:
+            logger.error("❌ %s timed out after %ss", title, self.test_timeout)
+            self.record_failure(name, f"timed out after {self.test_timeout}s")
+            return False
+        except Exception as e:
+            logger.error("❌ %s failed: %s", title, e)
+            self.record_failure(name, str(e))
+            return False
+        
+        self.test_results[name] = result
+        self.passed_tests += 1
+        self.total_tests += 1
+        return True
+    
+    def record_failure(self, name: str, detail: str):
+        """Record a failed test"""
+        self.test_results[name] = (Status.FAILED, detail)
+        self.failed_tests += 1
+        self.total_tests += 1
+    
+    async def setup_engine(self):
+        """Initialize the engine shared by the component tests"""
+        from core.digital_twin_engine import DigitalTwinEngine
+        
+        self.engine = DigitalTwinEngine()
+        try:
+            await self.engine.initialize()
+        except Exception as e:
+            if "OpenGL" in str(e) or "segmentation fault" in str(e):
+                logger.warning("⚠️ Shared engine initialized without OpenGL visualization (expected on macOS)")
+            else:
+                raise
+    
     async def test_core_system_initialization(self):
         """Test 1: Core System Initialization"""
         logger.info("\n🧪 Test 1: Core System Initialization")
         
+        # Import core components
+        from core.digital_twin_engine import DigitalTwinEngine
+        from core.config import settings
+        from core.database import db_manager
+        
+        # Test configuration loading
+        logger.info("Testing configuration loading...")
+        assert hasattr(settings, 'DATABASE_URL'), "Database URL not configured"
+        assert hasattr(settings, 'SECRET_KEY'), "Secret key not configured"
+        logger.info("✅ Configuration loaded successfully")
+        
+        # Test database manager
+        logger.info("Testing database manager...")
+        assert db_manager is not None, "Database manager not available"
+        logger.info("✅ Database manager available")
+        
+        # Test engine creation
+        logger.info("Testing engine creation...")
+        engine = DigitalTwinEngine()
+        assert engine is not None, "Failed to create Digital Twin Engine"
+        logger.info("✅ Engine creation successful")
+        
+        # Test engine initialization (without visualization engine)
+        logger.info("Testing engine initialization...")
         try:
-            # Import core components
-            from core.digital_twin_engine import DigitalTwinEngine
-            from core.config import settings
-            from core.database import db_manager
-            
-            # Test configuration loading
-            logger.info("Testing configuration loading...")
-            assert hasattr(settings, 'DATABASE_URL'), "Database URL not configured"
-            assert hasattr(settings, 'SECRET_KEY'), "Secret key not configured"
-            logger.info("✅ Configuration loaded successfully")
-            
-            # Test database manager
-            logger.info("Testing database manager...")
-            assert db_manager is not None, "Database manager not available"
-            logger.info("✅ Database manager available")
-            
-            # Test engine creation
-            logger.info("Testing engine creation...")
-            engine = DigitalTwinEngine()
-            assert engine is not None, "Failed to create Digital Twin Engine"
-            logger.info("✅ Engine creation successful")
-            
-            # Test engine initialization (without visualization engine)
-            logger.info("Testing engine initialization...")
-            try:
-                await engine.initialize()
-                assert engine.running, "Engine not running after initialization"
-                logger.info("✅ Engine initialization successful")
-            except Exception as e:
-                if "OpenGL" in str(e) or "segmentation fault" in str(e):
-                    logger.warning("⚠️ Engine initialization failed due to OpenGL issues (expected on macOS)")
-                    logger.info("✅ Core components working (OpenGL issue is separate)")
-                else:
-                    raise
-            
-            # Test system status
-            try:
-                status = engine.get_system_status()
-                logger.info("✅ System status retrieved")
-            except:
-                logger.info("✅ System status working (partial)")
-            
-            # Cleanup
-            try:
-                await engine.shutdown()
-            except:
-                pass
-            
-            self.test_results["core_system_initialization"] = "PASSED"
-            self.passed_tests += 1
-            
+            await engine.initialize()
+            assert engine.running, "Engine not running after initialization"
+            logger.info("✅ Engine initialization successful")
         except Exception as e:
-            logger.error(f"❌ Core System Initialization failed: {e}")
-            self.test_results["core_system_initialization"] = f"FAILED: {e}"
-            self.failed_tests += 1
+            if "OpenGL" in str(e) or "segmentation fault" in str(e):
+                logger.warning("⚠️ Engine initialization failed due to OpenGL issues (expected on macOS)")
+                logger.info("✅ Core components working (OpenGL issue is separate)")
+            else:
+                raise
         
-        self.total_tests += 1
+        # Test system status
+        try:
+            status = engine.get_system_status()
+            logger.info("✅ System status retrieved")
+        except:
+            logger.info("✅ System status working (partial)")
+        
+        # Cleanup
+        try:
+            await engine.shutdown()
+        except:
+            pass
     
     async def test_digital_twin_lifecycle(self):
         """Test 2: Digital Twin Lifecycle"""
         logger.info("\n🧪 Test 2: Digital Twin Lifecycle")
         
-        try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            from core.models.digital_twin import DigitalTwin
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test twin creation
-            logger.info("Testing twin creation...")
-            twin_data = {
-                "name": "Test Twin",
-                "description": "A test digital twin",
-                "twin_type": "human",
-                "metadata": {"test": True}
-            }
-            
-            twin_id = await engine.create_twin(twin_data)
-            assert twin_id, "Failed to create twin"
-            logger.info(f"✅ Twin created: {twin_id}")
-            
-            # Test twin retrieval
-            logger.info("Testing twin retrieval...")
-            twin = await engine.get_twin(twin_id)
-            assert twin is not None, "Failed to retrieve twin"
-            assert twin.profile.name == "Test Twin", "Twin name mismatch"
-            logger.info("✅ Twin retrieval successful")
-            
-            # Test twin update
-            logger.info("Testing twin update...")
-            update_data = {"profile": {"description": "Updated test twin"}}
-            success = await engine.update_twin(twin_id, update_data)
-            assert success, "Failed to update twin"
-            
-            updated_twin = await engine.get_twin(twin_id)
-            assert updated_twin.profile.description == "Updated test twin", "Update not applied"
-            logger.info("✅ Twin update successful")
-            
-            # Test twin deletion
-            logger.info("Testing twin deletion...")
-            success = await engine.delete_twin(twin_id)
-            assert success, "Failed to delete twin"
-            
-            deleted_twin = await engine.get_twin(twin_id)
-            assert deleted_twin is None, "Twin still exists after deletion"
-            logger.info("✅ Twin deletion successful")
-            
-            # Cleanup
-            await engine.shutdown()
-            
-            self.test_results["digital_twin_lifecycle"] = "PASSED"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ Digital Twin Lifecycle failed: {e}")
-            self.test_results["digital_twin_lifecycle"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        from core.models.digital_twin import DigitalTwin
         
-        self.total_tests += 1
+        # Use the shared engine
+        engine = self.engine
+        
+        # Test twin creation
+        logger.info("Testing twin creation...")
+        twin_data = {
+            "name": "Test Twin",
+            "description": "A test digital twin",
+            "twin_type": "human",
+            "metadata": {"test": True}
+        }
+        
+        twin_id = await engine.create_twin(twin_data)
+        assert twin_id, "Failed to create twin"
+        logger.info("✅ Twin created: %s", twin_id)
+        
+        # Test twin retrieval
+        logger.info("Testing twin retrieval...")
+        twin = await engine.get_twin(twin_id)
+        assert twin is not None, "Failed to retrieve twin"
+        assert twin.profile.name == "Test Twin", "Twin name mismatch"
+        logger.info("✅ Twin retrieval successful")
+        
+        # Test twin update
+        logger.info("Testing twin update...")
+        update_data = {"profile": {"description": "Updated test twin"}}
+        success = await engine.update_twin(twin_id, update_data)
+        assert success, "Failed to update twin"
+        
+        updated_twin = await engine.get_twin(twin_id)
+        assert updated_twin.profile.description == "Updated test twin", "Update not applied"
+        logger.info("✅ Twin update successful")
+        
+        # Test twin deletion
+        logger.info("Testing twin deletion...")
+        success = await engine.delete_twin(twin_id)
+        assert success, "Failed to delete twin"
+        
+        deleted_twin = await engine.get_twin(twin_id)
+        assert deleted_twin is None, "Twin still exists after deletion"
+        logger.info("✅ Twin deletion successful")
     
     async def test_ai_ml_components(self):
         """Test 3: AI/ML Components"""
         logger.info("\n🧪 Test 3: AI/ML Components")
         
-        try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test personality model
-            logger.info("Testing personality model...")
-            if engine.personality_model:
-                # Create a test twin for personality testing
-                twin_data = {"name": "AI Test Twin", "twin_type": "human"}
-                twin_id = await engine.create_twin(twin_data)
-                
-                # Test personality generation
-                personality = engine.personality_model.generate_synthetic_profile(25, "unspecified", "student")
-                assert personality is not None, "Failed to generate personality"
-                assert "personality_traits" in personality, "Personality missing traits"
-                logger.info("✅ Personality model working")
-                
-                # Cleanup test twin
-                await engine.delete_twin(twin_id)
-            else:
-                logger.warning("⚠️ Personality model not available")
-            
-            # Test behavior simulator
-            logger.info("Testing behavior simulator...")
-            if engine.behavior_simulator:
-                # Test behavior simulation
-                test_context = {"environment": "test", "time": "day"}
-                behavior = await engine.behavior_simulator.simulate_behavior(
-                    personality_traits={"extroversion": 0.8},
-                    context=test_context
-                )
-                assert behavior is not None, "Failed to simulate behavior"
-                logger.info("✅ Behavior simulator working")
-            else:
-                logger.warning("⚠️ Behavior simulator not available")
-            
-            # Test conversation engine
-            logger.info("Testing conversation engine...")
-            if engine.conversation_engine:
-                # Test conversation processing
-                response = await engine.conversation_engine.process_message(
-                    "Hello, how are you?",
-                    sender="test_user",
-                    conversation_id="test_conversation",
-                    context={"interaction_type": "greeting"}
-                )
-                assert response is not None, "Failed to process conversation"
-                logger.info("✅ Conversation engine working")
-            else:
-                logger.warning("⚠️ Conversation engine not available")
-            
-            # Cleanup
-            await engine.shutdown()
+        # Use the shared engine
+        engine = self.engine
+        
+        # Test personality model
+        logger.info("Testing personality model...")
+        if engine.personality_model:
+            # Create a test twin for personality testing
+            twin_data = {"name": "AI Test Twin", "twin_type": "human"}
+            twin_id = await engine.create_twin(twin_data)
             
-            self.test_results["ai_ml_components"] = "PASSED"
-            self.passed_tests += 1
+            # Test personality generation
+            personality = engine.personality_model.generate_synthetic_profile(25, "unspecified", "student")
+            assert personality is not None, "Failed to generate personality"
+            assert "personality_traits" in personality, "Personality missing traits"
+            logger.info("✅ Personality model working")
             
-        except Exception as e:
-            logger.error(f"❌ AI/ML Components failed: {e}")
-            self.test_results["ai_ml_components"] = f"FAILED: {e}"
-            self.failed_tests += 1
+            # Cleanup test twin
+            await engine.delete_twin(twin_id)
+        else:
+            logger.warning("⚠️ Personality model not available")
         
-        self.total_tests += 1
+        # Test behavior simulator
+        logger.info("Testing behavior simulator...")
+        if engine.behavior_simulator:
+            # Test behavior simulation
+            test_context = {"environment": "test", "time": "day"}
+            behavior = await engine.behavior_simulator.simulate_behavior(
+                personality_traits={"extroversion": 0.8},
+                context=test_context
+            )
+            assert behavior is not None, "Failed to simulate behavior"
+            logger.info("✅ Behavior simulator working")
+        else:
+            logger.warning("⚠️ Behavior simulator not available")
+        
+        # Test conversation engine
+        logger.info("Testing conversation engine...")
+        if engine.conversation_engine:
+            # Test conversation processing
+            response = await engine.conversation_engine.process_message(
+                "Hello, how are you?",
+                sender="test_user",
+                conversation_id="test_conversation",
+                context={"interaction_type": "greeting"}
+            )
+            assert response is not None, "Failed to process conversation"
+            logger.info("✅ Conversation engine working")
+        else:
+            logger.warning("⚠️ Conversation engine not available")
     
     async def test_data_management(self):
         """Test 4: Data Management"""
         logger.info("\n🧪 Test 4: Data Management")
         
-        try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test synthetic data manager
-            logger.info("Testing synthetic data manager...")
-            if engine.synthetic_data_manager:
-                # Test data generation
-                data = engine.synthetic_data_manager.generate_synthetic_data("test_twin")
-                assert data is not None, "Failed to generate synthetic data"
-                logger.info("✅ Synthetic data generation working")
-                
-                # Test data types
-                assert "personality" in data, "Personality data missing"
-                assert "health" in data, "Health data missing"
-                assert "behavior" in data, "Behavior data missing"
-                logger.info("✅ All data types present")
-            else:
-                logger.warning("⚠️ Synthetic data manager not available")
-            
-            # Cleanup
-            await engine.shutdown()
-            
-            self.test_results["data_management"] = "PASSED"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ Data Management failed: {e}")
-            self.test_results["data_management"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        # Use the shared engine
+        engine = self.engine
         
-        self.total_tests += 1
+        # Test synthetic data manager
+        logger.info("Testing synthetic data manager...")
+        if engine.synthetic_data_manager:
+            # Test data generation
+            data = engine.synthetic_data_manager.generate_synthetic_data("test_twin")
+            assert data is not None, "Failed to generate synthetic data"
+            logger.info("✅ Synthetic data generation working")
+            
+            # Test data types
+            assert "personality" in data, "Personality data missing"
+            assert "health" in data, "Health data missing"
+            assert "behavior" in data, "Behavior data missing"
+            logger.info("✅ All data types present")
+        else:
+            logger.warning("⚠️ Synthetic data manager not available")
     
     async def test_health_monitoring(self):
         """Test 5: Health Monitoring"""
         logger.info("\n🧪 Test 5: Health Monitoring")
         
-        try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test health monitor
-            logger.info("Testing health monitor...")
-            if engine.health_monitor:
-                # Test health data generation
-                health_data = engine.health_monitor.generate_health_data("test_twin")
-                assert health_data is not None, "Failed to generate health data"
-                logger.info("✅ Health data generation working")
-                
-                # Test health metrics
-                assert "heart_rate" in health_data, "Heart rate missing"
-                assert "blood_pressure" in health_data, "Blood pressure missing"
-                assert "temperature" in health_data, "Temperature missing"
-                logger.info("✅ All health metrics present")
-                
-                # Test health alerts (method not implemented yet)
-                logger.info("⚠️ Health alerts method not implemented yet")
-            else:
-                logger.warning("⚠️ Health monitor not available")
-            
-            # Cleanup
-            await engine.shutdown()
-            
-            self.test_results["health_monitoring"] = "PASSED"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ Health Monitoring failed: {e}")
-            self.test_results["health_monitoring"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        # Use the shared engine
+        engine = self.engine
         
-        self.total_tests += 1
+        # Test health monitor
+        logger.info("Testing health monitor...")
+        if engine.health_monitor:
+            # Test health data generation
+            health_data = engine.health_monitor.generate_health_data("test_twin")
+            assert health_data is not None, "Failed to generate health data"
+            logger.info("✅ Health data generation working")
+            
+            # Test health metrics
+            assert "heart_rate" in health_data, "Heart rate missing"
+            assert "blood_pressure" in health_data, "Blood pressure missing"
+            assert "temperature" in health_data, "Temperature missing"
+            logger.info("✅ All health metrics present")
+            
+            # Test health alerts (method not implemented yet)
+            logger.info("⚠️ Health alerts method not implemented yet")
+        else:
+            logger.warning("⚠️ Health monitor not available")
     
     async def test_visualization_engine(self):
         """Test 6: Visualization Engine"""
         logger.info("\n🧪 Test 6: Visualization Engine")
         
-        try:
-            logger.info("⚠️ Skipping visualization engine test due to OpenGL compatibility issues on macOS")
-            logger.info("This is a known issue with PyOpenGL on macOS and doesn't affect core functionality")
-            
-            self.test_results["visualization_engine"] = "SKIPPED (OpenGL compatibility)"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ Visualization Engine failed: {e}")
-            self.test_results["visualization_engine"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        logger.info("⚠️ Skipping visualization engine test due to OpenGL compatibility issues on macOS")
+        logger.info("This is a known issue with PyOpenGL on macOS and doesn't affect core functionality")
         
-        self.total_tests += 1
+        return Status.SKIPPED, "OpenGL compatibility"
     
     async def test_system_integration(self):
         """Test 7: System Integration"""
         logger.info("\n🧪 Test 7: System Integration")
         
-        try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test component communication
-            logger.info("Testing component communication...")
-            
-            # Create a twin
-            twin_data = {"name": "Integration Test Twin", "twin_type": "human"}
-            twin_id = await engine.create_twin(twin_data)
-            
-            # Test end-to-end workflow
-            if (engine.personality_model and engine.behavior_simulator and 
-                engine.conversation_engine and engine.health_monitor):
-                
-                # Generate personality
-                personality = engine.personality_model.generate_synthetic_profile(25, "unspecified", "student")
-                
-                # Simulate behavior
-                behavior = await engine.behavior_simulator.simulate_behavior(
-                    personality_traits=personality.get("personality_traits", {}),
-                    context={"test": True}
-                )
-                
-                # Process conversation
-                response = await engine.conversation_engine.process_message(
-                    "How are you feeling?",
-                    sender="test_user",
-                    conversation_id="integration_test",
-                    context={"interaction_type": "health_inquiry"}
-                )
-                
-                # Generate health data
-                health_data = engine.health_monitor.generate_health_data(twin_id)
-                
-                assert all([personality, behavior, response, health_data]), "Integration workflow failed"
-                logger.info("✅ System integration working")
-            else:
-                logger.warning("⚠️ Some components not available for integration test")
-            
-            # Cleanup
-            await engine.delete_twin(twin_id)
-            await engine.shutdown()
-            
-            self.test_results["system_integration"] = "PASSED"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ System Integration failed: {e}")
-            self.test_results["system_integration"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        # Use the shared engine
+        engine = self.engine
         
-        self.total_tests += 1
+        # Test component communication
+        logger.info("Testing component communication...")
+        
+        # Create a twin
+        twin_data = {"name": "Integration Test Twin", "twin_type": "human"}
+        twin_id = await engine.create_twin(twin_data)
+        
+        # Test end-to-end workflow
+        if (engine.personality_model and engine.behavior_simulator and 
+            engine.conversation_engine and engine.health_monitor):
+            
+            # Generate personality
+            personality = engine.personality_model.generate_synthetic_profile(25, "unspecified", "student")
+            
+            # Simulate behavior
+            behavior = await engine.behavior_simulator.simulate_behavior(
+                personality_traits=personality.get("personality_traits", {}),
+                context={"test": True}
+            )
+            
+            # Process conversation
+            response = await engine.conversation_engine.process_message(
+                "How are you feeling?",
+                sender="test_user",
+                conversation_id="integration_test",
+                context={"interaction_type": "health_inquiry"}
+            )
+            
+            # Generate health data
+            health_data = engine.health_monitor.generate_health_data(twin_id)
+            
+            assert all([personality, behavior, response, health_data]), "Integration workflow failed"
+            logger.info("✅ System integration working")
+        else:
+            logger.warning("⚠️ Some components not available for integration test")
+        
+        # Cleanup
+        await engine.delete_twin(twin_id)
     
     async def test_performance(self):
         """Test 8: Performance and Stress Tests"""
         logger.info("\n🧪 Test 8: Performance and Stress Tests")
         
-        try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            import time
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test twin creation performance
-            logger.info("Testing twin creation performance...")
-            start_time = time.time()
-            
-            twin_ids = []
-            for i in range(10):  # Create 10 twins
-                twin_data = {"name": f"Perf Twin {i}", "twin_type": "human"}
-                twin_id = await engine.create_twin(twin_data)
-                twin_ids.append(twin_id)
-            
-            creation_time = time.time() - start_time
-            logger.info(f"✅ Created 10 twins in {creation_time:.2f} seconds")
-            
-            # Test concurrent operations
-            logger.info("Testing concurrent operations...")
-            start_time = time.time()
-            
-            tasks = []
-            for twin_id in twin_ids:
-                task = engine.get_twin(twin_id)
-                tasks.append(task)
-            
-            results = await asyncio.gather(*tasks)
-            concurrent_time = time.time() - start_time
-            logger.info(f"✅ Concurrent retrieval in {concurrent_time:.2f} seconds")
-            
-            # Cleanup
-            for twin_id in twin_ids:
-                await engine.delete_twin(twin_id)
-            
-            await engine.shutdown()
-            
-            self.test_results["performance"] = "PASSED"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ Performance Tests failed: {e}")
-            self.test_results["performance"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        import time
         
-        self.total_tests += 1
+        # Use the shared engine
+        engine = self.engine
+        
+        # Test twin creation performance
+        logger.info("Testing twin creation performance...")
+        start_time = time.perf_counter()
+        
+        # Create 10 twins concurrently
+        twin_ids = await asyncio.gather(*(
+            engine.create_twin({"name": f"Perf Twin {i}", "twin_type": "human"})
+            for i in range(10)
+        ))
+        
+        creation_time = time.perf_counter() - start_time
+        logger.info("✅ Created 10 twins in %.2f seconds", creation_time)
+        
+        # Test concurrent operations
+        logger.info("Testing concurrent operations...")
+        start_time = time.perf_counter()
+        
+        tasks = []
+        for twin_id in twin_ids:
+            task = engine.get_twin(twin_id)
+            tasks.append(task)
+        
+        results = await asyncio.gather(*tasks)
+        concurrent_time = time.perf_counter() - start_time
+        logger.info("✅ Concurrent retrieval in %.2f seconds", concurrent_time)
+        
+        # Cleanup
+        await asyncio.gather(*(engine.delete_twin(twin_id) for twin_id in twin_ids))
     
     async def test_error_handling(self):
         """Test 9: Error Handling"""
         logger.info("\n🧪 Test 9: Error Handling")
         
+        # Use the shared engine
+        engine = self.engine
+        
+        # Test invalid twin ID
+        logger.info("Testing invalid twin ID handling...")
         try:
-            from core.digital_twin_engine import DigitalTwinEngine
-            
-            # Initialize engine
-            engine = DigitalTwinEngine()
-            await engine.initialize()
-            
-            # Test invalid twin ID
-            logger.info("Testing invalid twin ID handling...")
-            try:
-                invalid_twin = await engine.get_twin("invalid_id")
-                assert invalid_twin is None, "Should return None for invalid ID"
-                logger.info("✅ Invalid twin ID handled correctly")
-            except Exception as e:
-                logger.info(f"✅ Invalid twin ID handled: {e}")
-            
-            # Test invalid data
-            logger.info("Testing invalid data handling...")
-            try:
-                invalid_data = {"invalid": "data"}
-                twin_id = await engine.create_twin(invalid_data)
-                # Should either succeed or fail gracefully
-                logger.info("✅ Invalid data handled")
-            except Exception as e:
-                logger.info(f"✅ Invalid data handled: {e}")
-            
-            # Cleanup
-            await engine.shutdown()
-            
-            self.test_results["error_handling"] = "PASSED"
-            self.passed_tests += 1
-            
+            invalid_twin = await engine.get_twin("invalid_id")
+            assert invalid_twin is None, "Should return None for invalid ID"
+            logger.info("✅ Invalid twin ID handled correctly")
         except Exception as e:
-            logger.error(f"❌ Error Handling failed: {e}")
-            self.test_results["error_handling"] = f"FAILED: {e}"
-            self.failed_tests += 1
+            logger.info("✅ Invalid twin ID handled: %s", e)
         
-        self.total_tests += 1
+        # Test invalid data
+        logger.info("Testing invalid data handling...")
+        try:
+            invalid_data = {"invalid": "data"}
+            twin_id = await engine.create_twin(invalid_data)
+            # Should either succeed or fail gracefully
+            logger.info("✅ Invalid data handled")
+            await engine.delete_twin(twin_id)
+        except Exception as e:
+            logger.info("✅ Invalid data handled: %s", e)
     
     async def test_api_endpoints(self):
         """Test 10: API Endpoints"""
         logger.info("\n🧪 Test 10: API Endpoints")
         
-        try:
-            # Test API routes import
-            logger.info("Testing API routes...")
-            from api.routes import api_router
-            
-            assert api_router is not None, "API router not available"
-            logger.info("✅ API routes available")
-            
-            # Test UI routes import
-            logger.info("Testing UI routes...")
-            from ui.routes import ui_router
-            
-            assert ui_router is not None, "UI router not available"
-            logger.info("✅ UI routes available")
-            
-            self.test_results["api_endpoints"] = "PASSED"
-            self.passed_tests += 1
-            
-        except Exception as e:
-            logger.error(f"❌ API Endpoints failed: {e}")
-            self.test_results["api_endpoints"] = f"FAILED: {e}"
-            self.failed_tests += 1
+        # Test API routes import
+        logger.info("Testing API routes...")
+        from api.routes import api_router
         
-        self.total_tests += 1
+        assert api_router is not None, "API router not available"
+        logger.info("✅ API routes available")
+        
+        # Test UI routes import
+        logger.info("Testing UI routes...")
+        from ui.routes import ui_router
+        
+        assert ui_router is not None, "UI router not available"
+        logger.info("✅ UI routes available")
     
     async def generate_test_report(self):
         """Generate comprehensive test report"""
@@ -567,23 +469,24 @@ class ComprehensiveTester:
         logger.info(" COMPREHENSIVE TEST REPORT")
         logger.info("="*60)
         
-        logger.info(f"Test Duration: {duration}")
-        logger.info(f"Total Tests: {self.total_tests}")
-        logger.info(f"Passed: {self.passed_tests}")
-        logger.info(f"Failed: {self.failed_tests}")
-        logger.info(f"Success Rate: {(self.passed_tests/self.total_tests*100):.1f}%")
+        logger.info("Test Duration: %s", duration)
+        logger.info("Total Tests: %s", self.total_tests)
+        logger.info("Passed: %s", self.passed_tests)
+        logger.info("Failed: %s", self.failed_tests)
+        logger.info("Success Rate: %.1f%%", self.passed_tests/self.total_tests*100)
         
-        logger.info("\n📋 DETAILED RESULTS:")
-        for test_name, result in self.test_results.items():
-            status = "✅ PASSED" if "PASSED" in result else "❌ FAILED"
-            logger.info(f"{test_name}: {status}")
+        # One record for the whole table instead of one per test
+        logger.info("\n📋 DETAILED RESULTS:\n%s", "\n".join(
+            f"{test_name}: {status.value}" for test_name, (status, _) in self.test_results.items()
+        ))
         
         if self.failed_tests == 0:
             logger.info("\n🎉 ALL TESTS PASSED! System is working correctly.")
         else:
-            logger.info(f"\n⚠️ {self.failed_tests} tests failed. Review the errors above.")
+            logger.info("\n⚠️ %s tests failed. Review the errors above.", self.failed_tests)
         
         logger.info("="*60)
+        log_buffer.flush()
 
 async def main():
     """Main test runner"""
@@ -591,4 +494,11 @@ async def main():
     await tester.run_all_tests()
 
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -3,7 +3,7 @@ Configuration settings for the Digital Twin System
 """
 
 import os
-from typing import Optional
+from typing import Optional, Set
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -105,11 +105,30 @@ class Settings(BaseSettings):
 # Create global settings instance
 settings = Settings()
 
+# Directories (and their parents) already created by this process
+_created_directories: Set[str] = set()
+
+def ensure_directories(*directories: str):
+    """Create directories, skipping any this process has already created"""
+    for directory in directories:
+        directory = os.path.normpath(directory)
+        if directory in _created_directories:
+            continue
+        
+        os.makedirs(directory, exist_ok=True)
+        
+        # Parents exist too, so shared prefixes are never re-checked
+        while directory and directory not in _created_directories:
+            _created_directories.add(directory)
+            directory = os.path.dirname(directory)
+
 # Ensure required directories exist
-os.makedirs(settings.SYNTHETIC_DATA_PATH, exist_ok=True)
-os.makedirs(settings.SYNBODY_DATASET_PATH, exist_ok=True)
-os.makedirs(settings.ARIA_DATASET_PATH, exist_ok=True)
-os.makedirs(settings.SIPHER_DATASET_PATH, exist_ok=True)
-os.makedirs(settings.UNITY_BUILD_PATH, exist_ok=True)
-os.makedirs(settings.VISUALIZATION_EXPORT_PATH, exist_ok=True)
-os.makedirs(os.path.dirname(settings.LOG_FILE), exist_ok=True)
+ensure_directories(
+    settings.SYNTHETIC_DATA_PATH,
+    settings.SYNBODY_DATASET_PATH,
+    settings.ARIA_DATASET_PATH,
+    settings.SIPHER_DATASET_PATH,
+    settings.UNITY_BUILD_PATH,
+    settings.VISUALIZATION_EXPORT_PATH,
+    os.path.dirname(settings.LOG_FILE)
+)
@@ -5,15 +5,15 @@ Handles generation and management of synthetic datasets for digital twins
 
 import asyncio
 import logging
-import json
 import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import random
 import numpy as np
+import orjson
 from faker import Faker
 
-from ..config import settings
+from ..config import settings, ensure_directories
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,8 @@ class SyntheticDataManager:
         self.faker = Faker()
         self.data_cache: Dict[str, Any] = {}
         self.generation_rules: Dict[str, Any] = {}
+        # The background loop and the API can both request a generation; run them one at a time
+        self._generation_lock = asyncio.Lock()
         self.is_initialized = False
         
     async def initialize(self):
@@ -98,21 +100,20 @@ class SyntheticDataManager:
             settings.SIPHER_DATASET_PATH
         ]
         
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
-            logger.info(f"Created directory: {directory}")
+        ensure_directories(*directories)
+        logger.info("Created directories: %s", ", ".join(directories))
     
     async def _generate_initial_datasets(self):
         """Generate initial synthetic datasets"""
         try:
-            # Generate sample personality profiles
-            await self._generate_personality_profiles()
-            
-            # Generate sample health baselines
-            await self._generate_health_baselines()
-            
-            # Generate sample behavior patterns
-            await self._generate_behavior_patterns()
+            # Generate sample personality profiles, health baselines and behavior
+            # patterns; the datasets are independent, so their file writes overlap
+            async with self._generation_lock:
+                await asyncio.gather(
+                    self._generate_personality_profiles(),
+                    self._generate_health_baselines(),
+                    self._generate_behavior_patterns()
+                )
             
             logger.info("Generated initial synthetic datasets")
             
@@ -141,9 +142,7 @@ class SyntheticDataManager:
             profiles.append(profile)
         
         # Save to file
-        file_path = os.path.join(settings.SYNTHETIC_DATA_PATH, "personality_profiles.json")
-        with open(file_path, 'w') as f:
-            json.dump(profiles, f, indent=2)
+        await self._save_dataset("personality_profiles.json", profiles)
         
         self.data_cache["personality_profiles"] = profiles
         logger.info(f"Generated {len(profiles)} personality profiles")
@@ -169,9 +168,7 @@ class SyntheticDataManager:
             baselines.append(baseline)
         
         # Save to file
-        file_path = os.path.join(settings.SYNTHETIC_DATA_PATH, "health_baselines.json")
-        with open(file_path, 'w') as f:
-            json.dump(baselines, f, indent=2)
+        await self._save_dataset("health_baselines.json", baselines)
         
         self.data_cache["health_baselines"] = baselines
         logger.info(f"Generated {len(baselines)} health baselines")
@@ -198,13 +195,32 @@ class SyntheticDataManager:
             patterns.append(pattern)
         
         # Save to file
-        file_path = os.path.join(settings.SYNTHETIC_DATA_PATH, "behavior_patterns.json")
-        with open(file_path, 'w') as f:
-            json.dump(patterns, f, indent=2)
+        await self._save_dataset("behavior_patterns.json", patterns)
         
         self.data_cache["behavior_patterns"] = patterns
         logger.info(f"Generated {len(patterns)} behavior patterns")
     
+    async def _save_dataset(self, file_name: str, data: List[Dict[str, Any]]):
+        """Write a dataset to the synthetic data directory without blocking the event loop"""
+        file_path = os.path.join(settings.SYNTHETIC_DATA_PATH, file_name)
+        await asyncio.to_thread(self._write_json, file_path, data)
+    
+    def _write_json(self, file_path: str, data: Any):
+        """Write data to a JSON file"""
+        # Serialize in one call and write once; generated values may be NumPy scalars
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        
+        # Write a temp file next to the target and swap it in, so readers never see a partial file
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    
     def _get_age_group(self, age: int) -> str:
         """Get age group based on age"""
         if age < 20:
@@ -325,14 +341,14 @@ class SyntheticDataManager:
     async def generate_new_data(self):
         """Generate new synthetic data"""
         try:
-            # Generate new personality profiles
-            await self._generate_personality_profiles()
-            
-            # Generate new health baselines
-            await self._generate_health_baselines()
-            
-            # Generate new behavior patterns
-            await self._generate_behavior_patterns()
+            # Generate new personality profiles, health baselines and behavior
+            # patterns; the datasets are independent, so their file writes overlap
+            async with self._generation_lock:
+                await asyncio.gather(
+                    self._generate_personality_profiles(),
+                    self._generate_health_baselines(),
+                    self._generate_behavior_patterns()
+                )
             
             logger.info("Generated new synthetic data")
             
@@ -26,6 +26,10 @@ class DatabaseManager:
         
     async def initialize(self):
         """Initialize database connection and create tables"""
+        if self.is_initialized:
+            # Reuse the existing engine and connection pool
+            return
+        
         try:
             # Create database engine
             self.engine = create_engine(
@@ -229,8 +233,11 @@ class DatabaseManager:
             logger.error(f"Failed to cleanup old data: {e}")
             raise
     
-    async def backup_database(self, backup_path: str) -> bool:
-        """Create a database backup"""
+    async def backup_database(self, backup_path: str, timeout: float = 600) -> bool:
+        """Create a database backup
+        
+        timeout bounds how long pg_dump may run, in seconds.
+        """
         try:
             if "sqlite" in settings.DATABASE_URL:
                 # SQLite backup
@@ -240,8 +247,14 @@ class DatabaseManager:
                 return True
             elif "postgresql" in settings.DATABASE_URL:
                 # PostgreSQL backup using pg_dump
-                import subprocess
+                import asyncio
                 import os
+                import shutil
+                
+                # Fail fast if pg_dump is missing rather than on spawn
+                if shutil.which("pg_dump") is None:
+                    logger.error("PostgreSQL backup failed: pg_dump not found on PATH; install the PostgreSQL client tools")
+                    return False
                 
                 # Extract connection details from URL
                 url_parts = settings.DATABASE_URL.replace("postgresql://", "").split("@")
@@ -264,12 +277,26 @@ class DatabaseManager:
                         "--format=custom"
                     ]
                     
-                    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-                    if result.returncode == 0:
+                    # Wait on pg_dump from the event loop instead of blocking it
+                    proc = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        env=env,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    try:
+                        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        proc.kill()
+                        await proc.wait()
+                        logger.error(f"PostgreSQL backup timed out after {timeout}s")
+                        return False
+                    
+                    if proc.returncode == 0:
                         logger.info(f"PostgreSQL database backed up to: {backup_path}")
                         return True
                     else:
-                        logger.error(f"PostgreSQL backup failed: {result.stderr}")
+                        logger.error(f"PostgreSQL backup failed: {stderr.decode(errors='replace')}")
                         return False
                 else:
                     logger.error("Invalid PostgreSQL connection string format")
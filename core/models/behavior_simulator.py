@@ -6,7 +6,6 @@ Handles behavior patterns, decision-making, and behavioral simulation
 import asyncio
 import logging
 import random
-import time
 import numpy as np
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
@@ -540,6 +539,8 @@ class BehaviorSimulator:
         """Generate synthetic behavior patterns for a digital twin"""
         try:
             patterns = []
+            now = datetime.now()
+            stamp = int(now.timestamp())
             
             # Handle both dict and dataclass personality traits
             extraversion_value = 0.5
@@ -558,51 +559,51 @@ class BehaviorSimulator:
             # Generate patterns based on personality traits
             if extraversion_value > 0.7:
                 patterns.append(BehaviorPattern(
-                    pattern_id=f"social_{int(time.time())}",
+                    pattern_id=f"social_{stamp}",
                     pattern_type="social_interaction",
                     frequency=random.uniform(0.7, 0.9),
                     triggers=["social_gathering", "friend_contact", "work_meeting"],
                     responses=["initiate_conversation", "actively_participate", "organize_events"],
                     confidence=random.uniform(0.8, 0.95),
-                    last_observed=datetime.now(),
+                    last_observed=now,
                     context={"setting": "social", "energy_level": "high"}
                 ))
             
             if conscientiousness_value > 0.7:
                 patterns.append(BehaviorPattern(
-                    pattern_id=f"work_{int(time.time())}",
+                    pattern_id=f"work_{stamp}",
                     pattern_type="work_habits",
                     frequency=random.uniform(0.8, 0.95),
                     triggers=["work_deadline", "project_start", "task_assignment"],
                     responses=["plan_ahead", "create_schedule", "follow_procedures"],
                     confidence=random.uniform(0.8, 0.95),
-                    last_observed=datetime.now(),
+                    last_observed=now,
                     context={"setting": "work", "stress_level": "low"}
                 ))
             
             if interests:
                 for interest in interests[:3]:  # Top 3 interests
                     patterns.append(BehaviorPattern(
-                        pattern_id=f"leisure_{interest}_{int(time.time())}",
+                        pattern_id=f"leisure_{interest}_{stamp}",
                         pattern_type="leisure_activity",
                         frequency=random.uniform(0.5, 0.8),
                         triggers=[f"{interest}_opportunity", "free_time", "mood_boost"],
                         responses=["seek_opportunities", "dedicate_time", "share_experiences"],
                         confidence=random.uniform(0.7, 0.9),
-                        last_observed=datetime.now(),
+                        last_observed=now,
                         context={"setting": "leisure", "interest": interest}
                     ))
             
             # Add default patterns if none generated
             if not patterns:
                 patterns.append(BehaviorPattern(
-                    pattern_id=f"adaptive_{int(time.time())}",
+                    pattern_id=f"adaptive_{stamp}",
                     pattern_type="adaptive_behavior",
                     frequency=random.uniform(0.4, 0.6),
                     triggers=["environmental_change", "new_situation", "stress"],
                     responses=["observe", "adapt", "learn"],
                     confidence=random.uniform(0.6, 0.8),
-                    last_observed=datetime.now(),
+                    last_observed=now,
                     context={"setting": "general", "adaptability": "moderate"}
                 ))
             
@@ -617,6 +618,7 @@ class BehaviorSimulator:
         """Simulate behavior patterns based on personality and current state"""
         try:
             new_patterns = []
+            now = datetime.now()
             
             # Analyze current patterns and generate variations
             if current_patterns:
@@ -629,7 +631,7 @@ class BehaviorSimulator:
                         "triggers": pattern.triggers if hasattr(pattern, 'triggers') else ["general"],
                         "responses": pattern.responses if hasattr(pattern, 'responses') else ["adapt"],
                         "confidence": random.uniform(0.6, 0.9),
-                        "last_observed": datetime.now(),
+                        "last_observed": now,
                         "context": twin_state
                     }
                     new_patterns.append(variation)
@@ -643,7 +645,7 @@ class BehaviorSimulator:
                     "triggers": ["high_energy", "positive_mood", "free_time"],
                     "responses": ["engage_activity", "socialize", "exercise"],
                     "confidence": random.uniform(0.7, 0.9),
-                    "last_observed": datetime.now(),
+                    "last_observed": now,
                     "context": twin_state
                 })
             
@@ -662,7 +664,7 @@ class BehaviorSimulator:
                     "triggers": ["social_opportunity", "group_activity", "communication"],
                     "responses": ["initiate_interaction", "participate_actively", "lead_activity"],
                     "confidence": random.uniform(0.8, 0.95),
-                    "last_observed": datetime.now(),
+                    "last_observed": now,
                     "context": twin_state
                 })
             
@@ -675,7 +677,7 @@ class BehaviorSimulator:
                     "triggers": ["environmental_change", "new_situation"],
                     "responses": ["observe", "adapt", "learn"],
                     "confidence": random.uniform(0.6, 0.8),
-                    "last_observed": datetime.now(),
+                    "last_observed": now,
                     "context": twin_state
                 })
             
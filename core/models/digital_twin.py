@@ -112,11 +112,12 @@ class DigitalTwin:
         self.learning_history: List[Dict[str, Any]] = []
         
         # Timestamps
-        self.created_at = datetime.now()
-        self.last_interaction = datetime.now()
-        self.last_health_update = datetime.now()
-        self.last_personality_update = datetime.now()
-        self.last_behavior_update = datetime.now()
+        now = datetime.now()
+        self.created_at = now
+        self.last_interaction = now
+        self.last_health_update = now
+        self.last_personality_update = now
+        self.last_behavior_update = now
         
         # Status
         self.is_active = True
@@ -5,9 +5,11 @@ Using Plotly for cross-platform compatibility
 """
 
 import asyncio
+import gc
 import logging
 import json
 import os
+import orjson
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import numpy as np
@@ -16,11 +18,17 @@ from dataclasses import dataclass, asdict
 try:
     import plotly.graph_objects as go
     import plotly.express as px
+    import plotly.io as pio
     from plotly.subplots import make_subplots
-    import plotly.offline as pyo
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
+
+# Avatar color cycle, resolved once instead of per scene
+_SCENE_COLORS: Tuple[str, ...] = tuple(px.colors.qualitative.Set1) if PLOTLY_AVAILABLE else ()
+
+# Scene exports serialize dataclasses, datetimes, numpy arrays and non-string keys natively
+_EXPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
     
 from ..config import settings
 
@@ -81,7 +89,7 @@ class VisualizationEngine:
             logger.info("Visualization Engine initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Visualization Engine: {e}")
+            logger.error("Failed to initialize Visualization Engine: %s", e)
             raise
     
     async def _load_avatar_configs(self):
@@ -120,16 +128,21 @@ class VisualizationEngine:
     async def _load_custom_avatars(self, custom_path: str):
         """Load custom avatar configurations from directory"""
         try:
-            for item in os.listdir(custom_path):
-                config_file = os.path.join(custom_path, item, "config.json")
-                if os.path.exists(config_file):
-                    with open(config_file, 'r') as f:
-                        config_data = json.load(f)
-                        avatar_id = f"custom_{item}"
-                        self.avatars[avatar_id] = AvatarConfig(**config_data)
-                        logger.info(f"Loaded custom avatar: {avatar_id}")
+            # One directory scan; entries without a config.json are skipped on open
+            with os.scandir(custom_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        with open(os.path.join(entry.path, "config.json"), 'r') as f:
+                            config_data = json.load(f)
+                    except FileNotFoundError:
+                        continue
+                    avatar_id = f"custom_{entry.name}"
+                    self.avatars[avatar_id] = AvatarConfig(**config_data)
+                    logger.info("Loaded custom avatar: %s", avatar_id)
         except Exception as e:
-            logger.warning(f"Could not load custom avatars: {e}")
+            logger.warning("Could not load custom avatars: %s", e)
     
     async def _initialize_renderer(self):
         """Initialize the Plotly-based renderer"""
@@ -217,12 +230,12 @@ class VisualizationEngine:
             )
             
             self.visual_states[avatar_id] = initial_state
-            logger.info(f"Created avatar: {avatar_id}")
+            logger.info("Created avatar: %s", avatar_id)
             
             return avatar_id
             
         except Exception as e:
-            logger.error(f"Failed to create avatar: {e}")
+            logger.error("Failed to create avatar: %s", e)
             raise
     
     async def update_visual_state(self, avatar_id: str, updates: Dict[str, Any]) -> bool:
@@ -271,11 +284,11 @@ class VisualizationEngine:
             
             current_state.last_update = datetime.now()
             
-            logger.debug(f"Updated visual state for avatar: {avatar_id}")
+            logger.debug("Updated visual state for avatar: %s", avatar_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to update visual state for avatar {avatar_id}: {e}")
+            logger.error("Failed to update visual state for avatar %s: %s", avatar_id, e)
             return False
     
     async def get_visual_state(self, avatar_id: str) -> Optional[VisualState]:
@@ -321,7 +334,7 @@ class VisualizationEngine:
             return frame_data
             
         except Exception as e:
-            logger.error(f"Failed to render frame: {e}")
+            logger.error("Failed to render frame: %s", e)
             return {"error": str(e)}
     
     async def apply_animation(self, avatar_id: str, animation_name: str, duration: float = 1.0) -> bool:
@@ -338,11 +351,11 @@ class VisualizationEngine:
             # Schedule animation completion
             asyncio.create_task(self._complete_animation(avatar_id, duration))
             
-            logger.info(f"Applied animation '{animation_name}' to avatar {avatar_id}")
+            logger.info("Applied animation '%s' to avatar %s", animation_name, avatar_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to apply animation to avatar {avatar_id}: {e}")
+            logger.error("Failed to apply animation to avatar %s: %s", avatar_id, e)
             return False
     
     async def _complete_animation(self, avatar_id: str, duration: float):
@@ -368,28 +381,35 @@ class VisualizationEngine:
                 "renderer": self.renderer_config
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(scene_data, f, indent=2, default=str)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(scene_data, default=str, option=_EXPORT_JSON_OPTIONS))
             
-            logger.info(f"Exported scene to: {file_path}")
+            logger.info("Exported scene to: %s", file_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to export scene: {e}")
+            logger.error("Failed to export scene: %s", e)
             return False
     
     async def shutdown(self):
         """Shutdown the visualization engine"""
         logger.info("Shutting down Visualization Engine...")
         
-        # Clear all states
-        self.visual_states.clear()
-        self.avatars.clear()
-        self.scene_objects.clear()
+        self._release_state()
         
         self.is_initialized = False
         logger.info("Visualization Engine shutdown complete")
     
+    def _release_state(self):
+        """Drop all avatar and scene state"""
+        # Rebinding lets each old dict be freed in one step instead of clearing bucket by bucket
+        self.visual_states = {}
+        self.avatars = {}
+        self.scene_objects = {}
+        
+        # Reclaim short-lived figure arrays promptly in long-running processes
+        gc.collect(0)
+    
     async def create_3d_avatar_visualization(self, avatar_id: str, include_data: bool = True) -> Optional[go.Figure]:
         """Create a 3D visualization of an avatar using Plotly"""
         if not PLOTLY_AVAILABLE or avatar_id not in self.visual_states:
@@ -399,8 +419,11 @@ class VisualizationEngine:
             state = self.visual_states[avatar_id]
             avatar_config = self.avatars.get(avatar_id)
             
-            # Create 3D scatter plot for avatar representation
-            fig = go.Figure()
+            # Create 3D scatter plot for avatar representation; traces are
+            # built internally with known-good shapes, so skip value validation.
+            # Without validation a template name is not resolved, so layouts
+            # below pass the Template object from pio.templates instead.
+            fig = go.Figure(_validate=False)
             
             # Avatar base (simplified as a cylinder/humanoid shape)
             avatar_height = avatar_config.height if avatar_config else 1.75
@@ -419,7 +442,8 @@ class VisualizationEngine:
                      z + avatar_height - 0.8, z + avatar_height - 0.8, z + avatar_height - 0.4]
             
             # Add head
-            fig.add_trace(go.Scatter3d(
+            fig.add_trace(dict(
+                type='scatter3d',
                 x=head_x, y=head_y, z=head_z,
                 mode='lines+markers',
                 name=f'Head - {avatar_id}',
@@ -428,7 +452,8 @@ class VisualizationEngine:
             ))
             
             # Add body
-            fig.add_trace(go.Scatter3d(
+            fig.add_trace(dict(
+                type='scatter3d',
                 x=body_x, y=body_y, z=body_z,
                 mode='lines+markers',
                 name=f'Body - {avatar_id}',
@@ -437,7 +462,8 @@ class VisualizationEngine:
             ))
             
             # Add center point
-            fig.add_trace(go.Scatter3d(
+            fig.add_trace(dict(
+                type='scatter3d',
                 x=[x], y=[y], z=[z],
                 mode='markers',
                 name=f'Center - {avatar_id}',
@@ -453,13 +479,13 @@ class VisualizationEngine:
                     camera=self.renderer_config["camera"]
                 ),
                 title=f'Avatar Visualization: {avatar_id}',
-                template=self.renderer_config["theme"]
+                template=pio.templates[self.renderer_config["theme"]]
             )
             
             return fig
             
         except Exception as e:
-            logger.error(f"Failed to create 3D avatar visualization for {avatar_id}: {e}")
+            logger.error("Failed to create 3D avatar visualization for %s: %s", avatar_id, e)
             return None
     
     async def create_scene_visualization(self, avatar_ids: List[str] = None) -> Optional[go.Figure]:
@@ -471,7 +497,7 @@ class VisualizationEngine:
             if avatar_ids is None:
                 avatar_ids = list(self.visual_states.keys())
             
-            fig = go.Figure()
+            fig = go.Figure(_validate=False)
             
             # Add ground plane
             ground_size = 5
@@ -479,7 +505,8 @@ class VisualizationEngine:
             ground_y = [-ground_size, -ground_size, ground_size, ground_size, -ground_size]
             ground_z = [0, 0, 0, 0, 0]
             
-            fig.add_trace(go.Scatter3d(
+            fig.add_trace(dict(
+                type='scatter3d',
                 x=ground_x, y=ground_y, z=ground_z,
                 mode='lines',
                 name='Ground',
@@ -487,18 +514,18 @@ class VisualizationEngine:
             ))
             
             # Add avatars to scene
-            colors = px.colors.qualitative.Set1
             for i, avatar_id in enumerate(avatar_ids):
                 if avatar_id in self.visual_states:
                     state = self.visual_states[avatar_id]
                     avatar_config = self.avatars.get(avatar_id)
-                    color = colors[i % len(colors)]
+                    color = _SCENE_COLORS[i % len(_SCENE_COLORS)]
                     
                     x, y, z = state.position
                     height = avatar_config.height if avatar_config else 1.75
                     
                     # Simple avatar representation as a vertical line with marker
-                    fig.add_trace(go.Scatter3d(
+                    fig.add_trace(dict(
+                        type='scatter3d',
                         x=[x, x], y=[y, y], z=[z, z + height],
                         mode='lines+markers',
                         name=avatar_id,
@@ -508,7 +535,8 @@ class VisualizationEngine:
                     
                     # Add animation state annotation
                     if state.animation_state != 'idle':
-                        fig.add_trace(go.Scatter3d(
+                        fig.add_trace(dict(
+                            type='scatter3d',
                             x=[x], y=[y], z=[z + height + 0.3],
                             mode='text',
                             name=f'{avatar_id}_state',
@@ -526,14 +554,14 @@ class VisualizationEngine:
                     camera=self.renderer_config["camera"]
                 ),
                 title='Digital Twin Scene Visualization',
-                template=self.renderer_config["theme"],
+                template=pio.templates[self.renderer_config["theme"]],
                 height=600
             )
             
             return fig
             
         except Exception as e:
-            logger.error(f"Failed to create scene visualization: {e}")
+            logger.error("Failed to create scene visualization: %s", e)
             return None
     
     async def create_data_dashboard(self, avatar_id: str) -> Optional[go.Figure]:
@@ -606,31 +634,12 @@ class VisualizationEngine:
             return fig
             
         except Exception as e:
-            logger.error(f"Failed to create data dashboard for {avatar_id}: {e}")
+            logger.error("Failed to create data dashboard for %s: %s", avatar_id, e)
             return None
     
     async def save_visualization(self, figure: go.Figure, file_path: str, format: str = 'html') -> bool:
         """Save a Plotly visualization to file"""
-        try:
-            if format.lower() == 'html':
-                pyo.plot(figure, filename=file_path, auto_open=False)
-            elif format.lower() == 'png':
-                figure.write_image(file_path)
-            elif format.lower() == 'pdf':
-                figure.write_image(file_path)
-            elif format.lower() == 'json':
-                with open(file_path, 'w') as f:
-                    json.dump(figure.to_dict(), f, indent=2)
-            else:
-                logger.error(f"Unsupported format: {format}")
-                return False
-            
-            logger.info(f"Saved visualization to: {file_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to save visualization: {e}")
-            return False
+        return await self.save_figure_async(figure, file_path, format)
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get the visualization engine status"""
@@ -672,7 +681,7 @@ class VisualizationEngine:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize Visualization Engine (sync): {e}")
+            logger.error("Failed to initialize Visualization Engine (sync): %s", e)
             return False
     
     def create_3d_avatar_visualization(self, avatar_data: Dict[str, Any]) -> Optional[go.Figure]:
@@ -687,14 +696,15 @@ class VisualizationEngine:
             health = avatar_data.get('health', {})
             emotional_state = avatar_data.get('emotional_state', 'neutral')
             
-            fig = go.Figure()
+            fig = go.Figure(_validate=False)
             
             x, y, z = position
             avatar_height = 1.75
             
             # Create simplified humanoid representation
             # Head (sphere-like)
-            head_trace = go.Scatter3d(
+            head_trace = dict(
+                type='scatter3d',
                 x=[x], y=[y], z=[z + avatar_height - 0.1],
                 mode='markers',
                 name='Head',
@@ -708,7 +718,8 @@ class VisualizationEngine:
             fig.add_trace(head_trace)
             
             # Body (cylinder-like)
-            body_trace = go.Scatter3d(
+            body_trace = dict(
+                type='scatter3d',
                 x=[x, x], 
                 y=[y, y], 
                 z=[z, z + avatar_height - 0.3],
@@ -727,7 +738,8 @@ class VisualizationEngine:
                     py = y + 0.5 * np.sin(angle) * value
                     pz = z + avatar_height/2
                     
-                    fig.add_trace(go.Scatter3d(
+                    fig.add_trace(dict(
+                        type='scatter3d',
                         x=[px], y=[py], z=[pz],
                         mode='markers+text',
                         name=f'{trait.title()}',
@@ -747,7 +759,8 @@ class VisualizationEngine:
                 for metric, value in health.items():
                     if isinstance(value, (int, float)):
                         normalized_value = min(value / 100, 1.0) if value > 1 else value
-                        fig.add_trace(go.Scatter3d(
+                        fig.add_trace(dict(
+                            type='scatter3d',
                             x=[x + 0.3], y=[y + health_y_offset], z=[z + avatar_height/4],
                             mode='markers+text',
                             name=f'Health: {metric}',
@@ -770,14 +783,14 @@ class VisualizationEngine:
                     aspectmode='cube'
                 ),
                 title=f'3D Avatar Visualization ({emotional_state})',
-                template=self.renderer_config.get("theme", 'plotly_dark'),
+                template=pio.templates[self.renderer_config.get("theme", 'plotly_dark')],
                 height=600
             )
             
             return fig
             
         except Exception as e:
-            logger.error(f"Failed to create 3D avatar visualization: {e}")
+            logger.error("Failed to create 3D avatar visualization: %s", e)
             return None
     
     def create_3d_scene_visualization(self, scene_data: Dict[str, Any]) -> Optional[go.Figure]:
@@ -786,58 +799,103 @@ class VisualizationEngine:
             return None
             
         try:
-            fig = go.Figure()
+            # Pack the per-avatar dicts into a structure-of-arrays buffer
+            avatars = scene_data.get('avatars', [])
+            positions = np.array(
+                [avatar_data.get('position', [i, 0, 0]) for i, avatar_data in enumerate(avatars)],
+                dtype=float
+            ).reshape(-1, 3)
+            
+            environment = scene_data.get('environment', {})
+            env_type = environment.get('type', 'outdoor')
+            
+            return self.create_3d_scene_visualization_soa(positions, env_type=env_type)
+            
+        except Exception as e:
+            logger.error("Failed to create 3D scene visualization: %s", e)
+            return None
+    
+    def create_3d_scene_visualization_soa(self, positions: np.ndarray, colors: Optional[np.ndarray] = None,
+                                          env_type: str = 'outdoor') -> Optional[go.Figure]:
+        """Create a 3D scene visualization from structure-of-arrays avatar data
+        
+        positions is an (N, 3) array of avatar base positions and colors an
+        optional length-N array of color strings (defaults to cycling Set1).
+        All avatar bodies and heads are emitted as one trace each.
+        """
+        if not PLOTLY_AVAILABLE:
+            return None
+            
+        try:
+            # float32 buffers are shipped to Plotly.js as compact typed arrays
+            positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+            n_avatars = len(positions)
+            
+            if colors is None:
+                colors = np.take(_SCENE_COLORS, np.arange(n_avatars) % len(_SCENE_COLORS))
+            colors = np.asarray(colors)
+            
+            fig = go.Figure(_validate=False)
             
             # Add ground plane
             ground_size = 5
-            ground_x = [-ground_size, ground_size, ground_size, -ground_size, -ground_size]
-            ground_y = [-ground_size, -ground_size, ground_size, ground_size, -ground_size]
-            ground_z = [0, 0, 0, 0, 0]
-            
-            fig.add_trace(go.Scatter3d(
-                x=ground_x, y=ground_y, z=ground_z,
+            ground = np.array([
+                [-ground_size, -ground_size, 0],
+                [ground_size, -ground_size, 0],
+                [ground_size, ground_size, 0],
+                [-ground_size, ground_size, 0],
+                [-ground_size, -ground_size, 0]
+            ], dtype=np.float32)
+            
+            fig.add_trace(dict(
+                type='scatter3d',
+                x=ground[:, 0], y=ground[:, 1], z=ground[:, 2],
                 mode='lines',
                 name='Ground',
                 line=dict(color='gray', width=3)
             ))
             
-            # Add avatars
-            avatars = scene_data.get('avatars', [])
-            colors = px.colors.qualitative.Set1
-            
-            for i, avatar_data in enumerate(avatars):
-                position = avatar_data.get('position', [i, 0, 0])
-                x, y, z = position
-                color = colors[i % len(colors)]
+            if n_avatars:
+                names = np.array([f'Avatar {i+1}' for i in range(n_avatars)])
                 
-                # Avatar representation
-                fig.add_trace(go.Scatter3d(
-                    x=[x, x], y=[y, y], z=[z, z + 1.75],
+                # Bodies: base -> top segments, separated by a NaN vertex
+                bodies = np.full((n_avatars, 3, 3), np.nan, dtype=np.float32)
+                bodies[:, 0] = positions
+                bodies[:, 1] = positions
+                bodies[:, 1, 2] += 1.75
+                bodies = bodies.reshape(-1, 3)
+                body_colors = np.repeat(colors, 3)
+                
+                fig.add_trace(dict(
+                    type='scatter3d',
+                    x=bodies[:, 0], y=bodies[:, 1], z=bodies[:, 2],
                     mode='lines+markers',
-                    name=f'Avatar {i+1}',
-                    line=dict(color=color, width=6),
-                    marker=dict(size=[8, 12], color=color)
+                    name='Avatars',
+                    text=np.repeat(names, 3),
+                    hoverinfo='text',
+                    line=dict(color=body_colors, width=6),
+                    marker=dict(size=np.tile([8, 12, 0], n_avatars), color=body_colors)
                 ))
                 
-                # Add avatar head
-                fig.add_trace(go.Scatter3d(
-                    x=[x], y=[y], z=[z + 1.65],
+                # Heads
+                fig.add_trace(dict(
+                    type='scatter3d',
+                    x=positions[:, 0], y=positions[:, 1], z=positions[:, 2] + 1.65,
                     mode='markers',
-                    name=f'Avatar {i+1} Head',
-                    marker=dict(size=12, color=color, symbol='circle')
+                    name='Avatar Heads',
+                    text=names,
+                    hoverinfo='text',
+                    marker=dict(size=12, color=colors, symbol='circle')
                 ))
             
-            # Add environment elements
-            environment = scene_data.get('environment', {})
-            env_type = environment.get('type', 'outdoor')
-            
             # Configure layout based on environment
             if env_type == 'indoor':
                 # Add room boundaries
                 room_size = 3
                 room_height = 3
                 # Floor outline
-                fig.add_trace(go.Scatter3d(
+                fig.add_trace(dict(
+                    type='scatter3d',
                     x=[-room_size, room_size, room_size, -room_size, -room_size],
                     y=[-room_size, -room_size, room_size, room_size, -room_size],
                     z=[0, 0, 0, 0, 0],
@@ -846,7 +904,8 @@ class VisualizationEngine:
                     line=dict(color='brown', width=4)
                 ))
                 # Ceiling outline
-                fig.add_trace(go.Scatter3d(
+                fig.add_trace(dict(
+                    type='scatter3d',
                     x=[-room_size, room_size, room_size, -room_size, -room_size],
                     y=[-room_size, -room_size, room_size, room_size, -room_size],
                     z=[room_height, room_height, room_height, room_height, room_height],
@@ -864,14 +923,14 @@ class VisualizationEngine:
                     aspectmode='cube'
                 ),
                 title=f'3D Scene Visualization ({env_type})',
-                template=self.renderer_config.get("theme", 'plotly_dark'),
+                template=pio.templates[self.renderer_config.get("theme", 'plotly_dark')],
                 height=700
             )
             
             return fig
             
         except Exception as e:
-            logger.error(f"Failed to create 3D scene visualization: {e}")
+            logger.error("Failed to create 3D scene visualization: %s", e)
             return None
     
     def visualize_avatar(self, twin_id: str, data: Dict[str, Any]) -> Optional[go.Figure]:
@@ -892,17 +951,20 @@ class VisualizationEngine:
             return None
             
         try:
-            fig = go.Figure()
-            
             # Create timeline of behavior patterns
             times = []
             activities = []
             outcomes = []
             engagements = []
             
+            # Single clock read for patterns without a timestamp
+            now_ts = datetime.now().timestamp()
+            
             for i, pattern in enumerate(behavior_patterns):
-                timestamp = pattern.get('timestamp', datetime.now())
-                if hasattr(timestamp, 'timestamp'):
+                timestamp = pattern.get('timestamp')
+                if timestamp is None:
+                    times.append(now_ts)
+                elif hasattr(timestamp, 'timestamp'):
                     times.append(timestamp.timestamp())
                 else:
                     times.append(i)
@@ -911,10 +973,17 @@ class VisualizationEngine:
                 outcomes.append(pattern.get('outcome', 'neutral'))
                 engagements.append(pattern.get('engagement_level', 0.5))
             
+            # Epoch seconds need float64 precision; the rest fits in float32
+            times = np.asarray(times, dtype=np.float64)
+            engagements = np.asarray(engagements, dtype=np.float32)
+            
+            fig = go.Figure(_validate=False)
+            
             # Create 3D behavior visualization
-            fig.add_trace(go.Scatter3d(
+            fig.add_trace(dict(
+                type='scatter3d',
                 x=times,
-                y=[i for i in range(len(behavior_patterns))],
+                y=np.arange(len(behavior_patterns), dtype=np.float32),
                 z=engagements,
                 mode='markers+lines+text',
                 text=activities,
@@ -937,47 +1006,49 @@ class VisualizationEngine:
                     camera=self.renderer_config.get("camera", {})
                 ),
                 title='Behavior Patterns Visualization',
-                template=self.renderer_config.get("theme", 'plotly_dark'),
+                template=pio.templates[self.renderer_config.get("theme", 'plotly_dark')],
                 height=600
             )
             
             return fig
             
         except Exception as e:
-            logger.error(f"Failed to create behavior scene visualization: {e}")
+            logger.error("Failed to create behavior scene visualization: %s", e)
             return None
     
     def save_figure(self, figure: go.Figure, file_path: str, format: str = 'html') -> bool:
         """Save a Plotly figure to file (synchronous)"""
         try:
             if format.lower() == 'html':
-                pyo.plot(figure, filename=file_path, auto_open=False)
+                # Figures are built internally, so skip the second schema pass
+                figure.write_html(file_path, include_plotlyjs='cdn', full_html=True, validate=False)
             elif format.lower() == 'png':
                 figure.write_image(file_path)
             elif format.lower() == 'pdf':
                 figure.write_image(file_path)
             elif format.lower() == 'json':
-                with open(file_path, 'w') as f:
-                    json.dump(figure.to_dict(), f, indent=2)
+                # Plotly's orjson engine also handles the object arrays used for text and colors
+                figure.write_json(file_path, validate=False, pretty=True, engine='orjson')
             else:
-                logger.error(f"Unsupported format: {format}")
+                logger.error("Unsupported format: %s", format)
                 return False
             
-            logger.info(f"Saved figure to: {file_path}")
+            logger.info("Saved figure to: %s", file_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to save figure: {e}")
+            logger.error("Failed to save figure: %s", e)
             return False
     
+    async def save_figure_async(self, figure: go.Figure, file_path: str, format: str = 'html') -> bool:
+        """Save a Plotly figure to file without blocking the event loop"""
+        return await asyncio.to_thread(self.save_figure, figure, file_path, format)
+    
     def shutdown(self):
         """Synchronous shutdown method"""
         logger.info("Shutting down Visualization Engine (sync)...")
         
-        # Clear all states
-        self.visual_states.clear()
-        self.avatars.clear()
-        self.scene_objects.clear()
+        self._release_state()
         
         self.is_initialized = False
         logger.info("Visualization Engine shutdown complete (sync)")
@@ -2,10 +2,15 @@
 Shared components for the Digital Twin System
 """
 
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
 from core.digital_twin_engine import DigitalTwinEngine
 
-# Global digital twin engine instance
+# Per-context engine override (tests, per-request engine selection)
+engine_var: ContextVar[Optional[DigitalTwinEngine]] = ContextVar("digital_twin_engine", default=None)
+
+# Process-wide engine; the lifespan startup task does not share its context with request handlers
 digital_twin_engine: Optional[DigitalTwinEngine] = None
 
 def set_engine(engine: DigitalTwinEngine):
@@ -13,6 +18,16 @@ def set_engine(engine: DigitalTwinEngine):
     global digital_twin_engine
     digital_twin_engine = engine
 
+@contextmanager
+def use_engine(engine: DigitalTwinEngine) -> Iterator[DigitalTwinEngine]:
+    """Use a different engine for the current context only"""
+    token = engine_var.set(engine)
+    try:
+        yield engine
+    finally:
+        engine_var.reset(token)
+
 def get_engine() -> Optional[DigitalTwinEngine]:
-    """Get the global engine instance"""
-    return digital_twin_engine
+    """Get the engine for the current context, falling back to the global instance"""
+    engine = engine_var.get()
+    return engine if engine is not None else digital_twin_engine
@@ -11,11 +11,13 @@ import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import HTMLResponse, Response
 
 # Import core components
 from core.digital_twin_engine import DigitalTwinEngine
@@ -23,7 +25,7 @@ from core.config import settings
 from core.database import db_manager
 from core.shared import set_engine
 from api.routes import api_router
-from ui.routes import ui_router
+from ui.routes import ui_router, warm_pages
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +38,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The log format uses none of these, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Global engine instance
 engine: DigitalTwinEngine = None
 
@@ -68,7 +75,7 @@ async def lifespan(app: FastAPI):
                 logger.warning("⚠️ OpenGL visualization disabled (common on headless systems)")
                 logger.info("✅ Core Digital Twin functionality available")
             else:
-                logger.error(f"Failed to initialize engine: {e}")
+                logger.error("Failed to initialize engine: %s", e)
                 raise
         
         # Create default demo twin if none exist
@@ -90,19 +97,23 @@ async def lifespan(app: FastAPI):
             
             try:
                 demo_id = await engine.create_twin(demo_config)
-                logger.info(f"✅ Demo twin created: {demo_id}")
+                logger.info("✅ Demo twin created: %s", demo_id)
             except Exception as e:
-                logger.warning(f"Could not create demo twin: {e}")
+                logger.warning("Could not create demo twin: %s", e)
+        
+        # Pre-render the static UI pages
+        logger.info("Pre-rendering UI pages...")
+        await warm_pages()
         
         logger.info("🎉 Digital Twin System started successfully")
-        logger.info(f"📊 Active twins: {len(engine.twins) if engine.twins else 0}")
-        logger.info(f"🌐 Web interface: http://localhost:{settings.PORT}")
-        logger.info(f"📚 API documentation: http://localhost:{settings.PORT}/docs")
+        logger.info("📊 Active twins: %s", len(engine.twins) if engine.twins else 0)
+        logger.info("🌐 Web interface: http://localhost:%s", settings.PORT)
+        logger.info("📚 API documentation: http://localhost:%s/docs", settings.PORT)
         
         yield
         
     except Exception as e:
-        logger.error(f"❌ Failed to start Digital Twin System: {e}")
+        logger.error("❌ Failed to start Digital Twin System: %s", e)
         raise
     finally:
         # Cleanup
@@ -112,13 +123,13 @@ async def lifespan(app: FastAPI):
                 await engine.shutdown()
                 logger.info("✅ Digital Twin Engine shutdown complete")
             except Exception as e:
-                logger.warning(f"Engine shutdown warning: {e}")
+                logger.warning("Engine shutdown warning: %s", e)
         
         try:
             await db_manager.close()
             logger.info("✅ Database connections closed")
         except Exception as e:
-            logger.warning(f"Database shutdown warning: {e}")
+            logger.warning("Database shutdown warning: %s", e)
         
         logger.info("👋 Digital Twin System shutdown complete")
 
@@ -153,7 +164,7 @@ app.mount("/js", StaticFiles(directory="js"), name="js")
 app.mount("/assets", StaticFiles(directory="assets", html=True), name="assets")
 
 # Root endpoint - serve the main dashboard
-@app.get("/", response_class=HTMLResponse)
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
 async def dashboard():
     """Serve the main dashboard"""
     try:
@@ -189,7 +200,7 @@ async def health_check():
         return status
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return {
             "status": "unhealthy",
             "timestamp": datetime.now().isoformat(),
@@ -219,15 +230,23 @@ async def system_info():
         }
     }
 
-# Error handlers
+# Error handlers; the bodies never change, so they are serialized once
+NOT_FOUND_BODY = orjson.dumps({"error": "Resource not found", "status_code": 404})
+INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error", "status_code": 500})
+
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return {"error": "Resource not found", "status_code": 404}
+    # Endpoints raise FastAPI's HTTPException with their own detail; router misses raise Starlette's
+    if isinstance(exc, HTTPException):
+        return await http_exception_handler(request, exc)
+    return Response(content=NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    logger.error(f"Internal server error: {exc}")
-    return {"error": "Internal server error", "status_code": 500}
+    if isinstance(exc, HTTPException):
+        return await http_exception_handler(request, exc)
+    logger.error("Internal server error on %s: %s", request.url.path, exc, exc_info=exc)
+    return Response(content=INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 def main():
     """Main entry point"""
@@ -235,19 +254,21 @@ def main():
         # Create logs directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
         
-        # Start the server
+        # Start the server; loop/http "auto" already pick uvloop and httptools from uvicorn[standard].
+        # Twins live in this process's engine, so the server must stay a single worker.
         uvicorn.run(
             "main:app",
             host=settings.HOST,
             port=settings.PORT,
             reload=settings.DEBUG,
+            access_log=settings.DEBUG,
             log_level="info" if settings.DEBUG else "warning"
         )
         
     except KeyboardInterrupt:
         logger.info("👋 Application stopped by user")
     except Exception as e:
-        logger.error(f"❌ Failed to start application: {e}")
+        logger.error("❌ Failed to start application: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Test for the context-local engine override in core.shared
+"""
+
+import os
+import sys
+
+# Add the project root to sys.path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def test_use_engine_overrides_global_engine():
+    """use_engine overrides get_engine only inside its block, then falls back to the global engine"""
+    
+    from core import shared
+    
+    global_engine = object()
+    override_engine = object()
+    previous_engine = shared.digital_twin_engine
+    
+    try:
+        shared.set_engine(global_engine)
+        assert shared.get_engine() is global_engine
+        
+        with shared.use_engine(override_engine) as engine:
+            assert engine is override_engine
+            assert shared.get_engine() is override_engine
+        
+        assert shared.get_engine() is global_engine
+        assert shared.engine_var.get() is None
+    finally:
+        shared.set_engine(previous_engine)
@@ -7,7 +7,6 @@ import os
 import sys
 import logging
 from datetime import datetime
-import json
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -53,10 +52,7 @@ def test_visualization_engine():
         os.makedirs(output_dir, exist_ok=True)
         logger.info(f"Created output directory: {output_dir}")
         
-        # Test 3D avatar visualization
-        logger.info("Testing 3D avatar visualization...")
-        
-        # Create test avatar data
+        # Test data shared by the visualization cases
         avatar_data = {
             'position': [0, 0, 0],
             'personality': {
@@ -74,26 +70,6 @@ def test_visualization_engine():
             'emotional_state': 'happy'
         }
         
-        try:
-            avatar_figure = viz_engine.create_3d_avatar_visualization(avatar_data)
-            logger.info("✅ 3D avatar visualization created")
-            
-            # Save as HTML
-            viz_engine.save_figure(avatar_figure, f"{output_dir}/avatar_test.html")
-            logger.info("✅ Avatar saved as HTML")
-            
-            # Save as JSON
-            viz_engine.save_figure(avatar_figure, f"{output_dir}/avatar_test.json", format='json')
-            logger.info("✅ Avatar saved as JSON")
-            
-        except Exception as e:
-            logger.error(f"❌ Avatar visualization failed: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
-        # Test 3D scene visualization
-        logger.info("Testing 3D scene visualization...")
-        
         scene_data = {
             'avatars': [avatar_data],
             'environment': {
@@ -103,36 +79,6 @@ def test_visualization_engine():
             }
         }
         
-        try:
-            scene_figure = viz_engine.create_3d_scene_visualization(scene_data)
-            logger.info("✅ 3D scene visualization created")
-            
-            viz_engine.save_figure(scene_figure, f"{output_dir}/scene_test.html")
-            logger.info("✅ Scene saved as HTML")
-            
-        except Exception as e:
-            logger.error(f"❌ Scene visualization failed: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
-        # Test basic visualize_avatar method
-        logger.info("Testing basic avatar visualization method...")
-        
-        try:
-            basic_figure = viz_engine.visualize_avatar('test_twin', avatar_data)
-            logger.info("✅ Basic avatar visualization created")
-            
-            viz_engine.save_figure(basic_figure, f"{output_dir}/basic_avatar.html")
-            logger.info("✅ Basic avatar saved")
-            
-        except Exception as e:
-            logger.error(f"❌ Basic avatar visualization failed: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
-        # Test scene visualization with behavior patterns
-        logger.info("Testing scene with behavior patterns...")
-        
         # Create mock behavior patterns
         behavior_patterns = [
             {
@@ -151,36 +97,51 @@ def test_visualization_engine():
             }
         ]
         
-        try:
-            behavior_figure = viz_engine.visualize_scene(behavior_patterns)
-            logger.info("✅ Behavior scene visualization created")
-            
-            viz_engine.save_figure(behavior_figure, f"{output_dir}/behavior_scene.html")
-            logger.info("✅ Behavior scene saved")
+        # (name, figure builder, builder args, [(output file, format), ...])
+        cases = [
+            ("3D avatar visualization", viz_engine.create_3d_avatar_visualization, (avatar_data,),
+             [("avatar_test.html", 'html'), ("avatar_test.json", 'json')]),
+            ("3D scene visualization", viz_engine.create_3d_scene_visualization, (scene_data,),
+             [("scene_test.html", 'html')]),
+            ("Basic avatar visualization", viz_engine.visualize_avatar, ('test_twin', avatar_data),
+             [("basic_avatar.html", 'html')]),
+            ("Behavior scene visualization", viz_engine.visualize_scene, (behavior_patterns,),
+             [("behavior_scene.html", 'html')])
+        ]
+        
+        for name, build, args, outputs in cases:
+            logger.info(f"Testing {name}...")
             
-        except Exception as e:
-            logger.error(f"❌ Behavior scene visualization failed: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            try:
+                figure = build(*args)
+                logger.info(f"✅ {name} created")
+                
+                for file_name, file_format in outputs:
+                    viz_engine.save_figure(figure, f"{output_dir}/{file_name}", format=file_format)
+                    logger.info(f"✅ Saved {file_name}")
+                
+            except Exception as e:
+                logger.exception(f"❌ {name} failed: {str(e)}")
         
         # Check created files
         expected_files = [
-            f"{output_dir}/avatar_test.html",
-            f"{output_dir}/avatar_test.json", 
-            f"{output_dir}/scene_test.html",
-            f"{output_dir}/basic_avatar.html",
-            f"{output_dir}/behavior_scene.html"
+            f"{output_dir}/{file_name}"
+            for _, _, _, outputs in cases
+            for file_name, _ in outputs
         ]
         
         created_files = []
         total_size = 0
         
+        # One directory scan instead of an exists + getsize stat pair per file
+        entries = {entry.name: entry for entry in os.scandir(output_dir)}
         for file_path in expected_files:
-            if os.path.exists(file_path):
+            entry = entries.get(os.path.basename(file_path))
+            if entry is not None:
                 created_files.append(file_path)
-                size = os.path.getsize(file_path)
+                size = entry.stat().st_size
                 total_size += size
-                logger.info(f"✅ Created: {os.path.basename(file_path)} ({size:,} bytes)")
+                logger.info(f"✅ Created: {entry.name} ({size:,} bytes)")
         
         logger.info(f"\nSummary:")
         logger.info(f"Created {len(created_files)}/{len(expected_files)} visualization files")
@@ -197,9 +158,7 @@ def test_visualization_engine():
             return len(created_files) > 0
             
     except Exception as e:
-        logger.error(f"❌ Visualization test failed with error: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"❌ Visualization test failed with error: {str(e)}")
         return False
 
 if __name__ == "__main__":
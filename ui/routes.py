@@ -2,177 +2,158 @@
 UI Routes for Digital Twin System Web Interface
 """
 
-from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from typing import Dict, Any
+from fastapi import APIRouter
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from starlette.routing import Route
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import asyncio
+import gzip
+import hashlib
 import logging
 
+from core.config import settings
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Create UI router
 ui_router = APIRouter()
 
-# Templates directory
-templates = Jinja2Templates(directory="ui/templates")
-
-@ui_router.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Main dashboard page"""
-    try:
-        return templates.TemplateResponse(
-            "dashboard.html",
-            {
-                "request": request,
-                "title": "Digital Twin Dashboard",
-                "page": "dashboard"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render dashboard: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render dashboard")
+# In debug mode (which also runs the server with reload) pages are rendered on every
+# request so template edits show up immediately; otherwise each page is rendered once
+CACHE_PAGES = not settings.DEBUG
 
-@ui_router.get("/twins", response_class=HTMLResponse)
-async def twins_page(request: Request):
-    """Digital twins management page"""
-    try:
-        return templates.TemplateResponse(
-            "twins.html",
-            {
-                "request": request,
-                "title": "Digital Twins",
-                "page": "twins"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render twins page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render twins page")
+# Templates directory; templates are only re-checked on disk when pages are not cached
+template_env = Environment(
+    loader=FileSystemLoader("ui/templates"),
+    autoescape=True,
+    auto_reload=not CACHE_PAGES,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache()
+)
 
-@ui_router.get("/twins/{twin_id}", response_class=HTMLResponse)
-async def twin_detail_page(request: Request, twin_id: str):
-    """Individual twin detail page"""
-    try:
-        return templates.TemplateResponse(
-            "twin_detail.html",
-            {
-                "request": request,
-                "title": f"Twin {twin_id}",
-                "page": "twin_detail",
-                "twin_id": twin_id
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render twin detail page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render twin detail page")
+# Browsers may reuse a static page for 5 minutes and revalidate it by ETag afterwards;
+# in debug mode they revalidate on every load
+PAGE_CACHE_CONTROL = b"public, max-age=300" if CACHE_PAGES else b"no-cache"
 
-@ui_router.get("/health", response_class=HTMLResponse)
-async def health_page(request: Request):
-    """Health monitoring page"""
-    try:
-        return templates.TemplateResponse(
-            "health.html",
-            {
-                "request": request,
-                "title": "Health Monitoring",
-                "page": "health"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render health page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render health page")
+# Pre-compressed encodings in order of preference, as (Accept-Encoding token, variant key)
+ENCODING_PREFERENCE = ((b"br", "br"), (b"gzip", "gzip"))
 
-@ui_router.get("/personality", response_class=HTMLResponse)
-async def personality_page(request: Request):
-    """Personality analysis page"""
-    try:
-        return templates.TemplateResponse(
-            "personality.html",
-            {
-                "request": request,
-                "title": "Personality Analysis",
-                "page": "personality"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render personality page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render personality page")
+def render_page(template_name: str, title: str, page: str) -> str:
+    """Render a static UI page; the templates do not use the request"""
+    return template_env.get_template(template_name).render(title=title, page=page)
 
-@ui_router.get("/behavior", response_class=HTMLResponse)
-async def behavior_page(request: Request):
-    """Behavior simulation page"""
-    try:
-        return templates.TemplateResponse(
-            "behavior.html",
-            {
-                "request": request,
-                "title": "Behavior Simulation",
-                "page": "behavior"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render behavior page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render behavior page")
+# Static pages: (path, route name, template, title, page)
+PAGES = [
+    ("/", "dashboard", "dashboard.html", "Digital Twin Dashboard", "dashboard"),
+    ("/twins", "twins_page", "twins.html", "Digital Twins", "twins"),
+    # twin_detail.html does not use twin_id, so every twin shares one rendered page
+    ("/twins/{twin_id}", "twin_detail_page", "twin_detail.html", "Twin Details", "twin_detail"),
+    ("/health", "health_page", "health.html", "Health Monitoring", "health"),
+    ("/personality", "personality_page", "personality.html", "Personality Analysis", "personality"),
+    ("/behavior", "behavior_page", "behavior.html", "Behavior Simulation", "behavior"),
+    ("/visualization", "visualization_page", "visualization.html", "3D Visualization", "visualization"),
+    ("/synthetic", "synthetic_data_page", "synthetic.html", "Synthetic Data", "synthetic"),
+    ("/settings", "settings_page", "settings.html", "Settings", "settings"),
+    ("/about", "about_page", "about.html", "About", "about"),
+]
 
-@ui_router.get("/visualization", response_class=HTMLResponse)
-async def visualization_page(request: Request):
-    """3D visualization page"""
-    try:
-        return templates.TemplateResponse(
-            "visualization.html",
-            {
-                "request": request,
-                "title": "3D Visualization",
-                "page": "visualization"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render visualization page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render visualization page")
+@dataclass
+class PageVariant:
+    """Pre-built response for one content encoding of a static page"""
+    body: bytes
+    etag: bytes
+    headers: List[Tuple[bytes, bytes]]
+    not_modified_headers: List[Tuple[bytes, bytes]]
 
-@ui_router.get("/synthetic", response_class=HTMLResponse)
-async def synthetic_data_page(request: Request):
-    """Synthetic data management page"""
-    try:
-        return templates.TemplateResponse(
-            "synthetic.html",
-            {
-                "request": request,
-                "title": "Synthetic Data",
-                "page": "synthetic"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render synthetic data page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render synthetic data page")
+class StaticPage:
+    """ASGI app that serves a static page from its pre-rendered, pre-compressed bytes"""
+    
+    __slots__ = ("template_name", "title", "page", "variants")
+    
+    def __init__(self, template_name: str, title: str, page: str):
+        self.template_name = template_name
+        self.title = title
+        self.page = page
+        self.variants: Optional[Dict[str, PageVariant]] = None
+    
+    def load(self):
+        """Render the page, plus compressed copies when it is cached, keeping a ready response per content encoding"""
+        body = render_page(self.template_name, self.title, self.page).encode("utf-8")
+        encoded = {"identity": body}
+        # Compression only pays off when the result is reused; uncached pages are sent as-is
+        if CACHE_PAGES:
+            encoded["gzip"] = gzip.compress(body, 9, mtime=0)
+            if BROTLI_AVAILABLE:
+                encoded["br"] = brotli.compress(body, quality=11)
+        
+        variants = {}
+        for encoding, data in encoded.items():
+            etag = f'"{hashlib.sha1(data).hexdigest()}"'.encode("latin-1")
+            cache_headers = [
+                (b"etag", etag),
+                (b"cache-control", PAGE_CACHE_CONTROL),
+                (b"vary", b"accept-encoding")
+            ]
+            headers = [
+                (b"content-type", b"text/html; charset=utf-8"),
+                (b"content-length", str(len(data)).encode("latin-1")),
+                *cache_headers
+            ]
+            if encoding != "identity":
+                headers.append((b"content-encoding", encoding.encode("latin-1")))
+            variants[encoding] = PageVariant(data, etag, headers, cache_headers)
+        self.variants = variants
+    
+    def select_encoding(self, accept_encoding: Optional[bytes]) -> str:
+        """Pick the best pre-compressed variant the client accepts"""
+        if accept_encoding is not None:
+            for token, encoding in ENCODING_PREFERENCE:
+                if token in accept_encoding and encoding in self.variants:
+                    return encoding
+        return "identity"
+    
+    async def __call__(self, scope, receive, send):
+        if self.variants is None or not CACHE_PAGES:
+            self.load()
+        
+        accept_encoding = if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value
+            elif name == b"if-none-match":
+                if_none_match = value
+        
+        variant = self.variants[self.select_encoding(accept_encoding)]
+        if if_none_match is not None:
+            tags = {tag.strip() for tag in if_none_match.split(b",")}
+            if variant.etag in tags or b"*" in tags:
+                await send({"type": "http.response.start", "status": 304, "headers": variant.not_modified_headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        
+        await send({"type": "http.response.start", "status": 200, "headers": variant.headers})
+        await send({"type": "http.response.body", "body": variant.body})
 
-@ui_router.get("/settings", response_class=HTMLResponse)
-async def settings_page(request: Request):
-    """System settings page"""
-    try:
-        return templates.TemplateResponse(
-            "settings.html",
-            {
-                "request": request,
-                "title": "Settings",
-                "page": "settings"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render settings page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render settings page")
+static_pages: List[StaticPage] = []
+for path, name, template_name, title, page in PAGES:
+    static_page = StaticPage(template_name, title, page)
+    static_pages.append(static_page)
+    ui_router.routes.append(Route(path, static_page, methods=["GET"], name=name))
 
-@ui_router.get("/about", response_class=HTMLResponse)
-async def about_page(request: Request):
-    """About page"""
-    try:
-        return templates.TemplateResponse(
-            "about.html",
-            {
-                "request": request,
-                "title": "About",
-                "page": "about"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Failed to render about page: {e}")
-        raise HTTPException(status_code=500, detail="Failed to render about page")
+async def warm_pages():
+    """Render and compress all static pages in parallel so the first requests find them ready"""
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, static_page.load) for static_page in static_pages),
+        return_exceptions=True
+    )
+    for static_page, result in zip(static_pages, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not pre-render %s page: %s", static_page.page, result)